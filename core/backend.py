@@ -5,15 +5,25 @@ Backend module for Clair Obscur: Expedition 33 Configuration.
 Handles all configuration management logic independently of UI.
 """
 
-import configparser
+import contextlib
+import functools
+import os
 import shutil
-import tomllib
+import stat
+import sys
+from collections.abc import Mapping
+from core import fast_ini
 from pathlib import Path
-from typing import Any, Optional
+from types import MappingProxyType
+from typing import Any, NamedTuple, Optional
+
+_TOML_PATH = Path(__file__).parent.parent / "config.toml"
 
 
 def get_version():
     """Get version from pyproject.toml"""
+    import tomllib
+
     toml_load = tomllib.load
     open_mode = 'rb'
 
@@ -25,125 +35,274 @@ def get_version():
     return "unknown"
 
 
+class TomlConfig(NamedTuple):
+    """Read-only view of the tables in config.toml."""
+
+    paths: Mapping[str, str]
+    presets: Mapping[str, Mapping[str, Mapping[str, Any]]]
+    engine_tweaks: Mapping[str, Mapping[str, Any]]
+
+
+def _freeze(value: Any) -> Any:
+    """Recursively wrap TOML tables in read-only mapping proxies."""
+    if isinstance(value, dict):
+        return MappingProxyType({key: _freeze(item) for key, item in value.items()})
+    if isinstance(value, list):
+        return tuple(_freeze(item) for item in value)
+    return value
+
+
+@functools.lru_cache(maxsize=1)
+def _load_toml_config() -> TomlConfig:
+    """Parse config.toml once per process into a shared read-only view."""
+    import tomllib
+
+    with open(_TOML_PATH, "rb") as f:
+        data = tomllib.load(f)
+
+    return TomlConfig(
+        paths=_freeze(data["paths"]),
+        presets=_freeze(data["presets"]),
+        engine_tweaks=_freeze(data["engine_tweaks"]),
+    )
+
+
+@functools.lru_cache(maxsize=16)
+def _preset(name: str) -> Mapping[str, Mapping[str, Any]]:
+    """Resolve a preset by name, falling back to balanced."""
+    presets = _load_toml_config().presets
+    return presets.get(name, presets["balanced"])
+
+
+@functools.lru_cache(maxsize=1)
+def _engine_tweaks() -> Mapping[str, Mapping[str, Any]]:
+    """Engine tweak sections from config.toml."""
+    return _load_toml_config().engine_tweaks
+
+
+def _stringify(sections: Mapping[str, Mapping[str, Any]]) -> dict[str, dict[str, str]]:
+    """Coerce every value to the string form written to Engine.ini."""
+    return {section: {key: str(value) for key, value in settings.items()} for section, settings in sections.items()}
+
+
+@functools.lru_cache(maxsize=16)
+def _preset_strings(name: str) -> dict[str, dict[str, str]]:
+    """Pre-stringified mirror of _preset. Shared result; do not mutate."""
+    return _stringify(_preset(name))
+
+
+@functools.lru_cache(maxsize=1)
+def _engine_tweak_strings() -> dict[str, dict[str, str]]:
+    """Pre-stringified mirror of _engine_tweaks. Shared result; do not mutate."""
+    return _stringify(_engine_tweaks())
+
+
+def _snapshot(src: Path, dst: Path) -> None:
+    """Copy src to dst, as a copy-on-write reflink on filesystems that support it (btrfs, xfs)."""
+    try:
+        from fcntl import FICLONE, ioctl
+    except ImportError:  # Windows, or Python < 3.12
+        shutil.copy2(src, dst)
+        return
+
+    try:
+        with open(src, "rb") as src_file, open(dst, "wb") as dst_file:
+            ioctl(dst_file.fileno(), FICLONE, src_file.fileno())
+    except OSError:
+        # Filesystem without reflink support (ext4, tmpfs, NTFS via Proton, ...)
+        shutil.copy2(src, dst)
+    else:
+        shutil.copystat(src, dst)
+
+
+class Backup(NamedTuple):
+    """Result of backing up Engine.ini."""
+
+    path: Path
+    # False when the existing backup already matched Engine.ini and no copy was made
+    created: bool
+
+
+def resolve_config_path(game_version: str = "steam", config_path: Path | None = None) -> Path:
+    """Resolve the config directory for a game version or custom path."""
+    if config_path:
+        return Path(config_path)
+
+    paths = _load_toml_config().paths
+    if game_version == "gamepass":
+        # GamePass path
+        return Path.home() / paths["gamepass_path"]
+    # Default Steam Proton path
+    return Path.home() / paths["steam_path"]
+
+
+def set_file_read_only(path: Path, read_only: bool = True) -> None:
+    """Clear or restore the owner write bit on path, doing nothing if it does not exist."""
+    try:
+        current_mode = os.stat(path).st_mode
+    except FileNotFoundError:
+        return
+
+    # Remove write permissions for read-only, add them back otherwise
+    new_mode = current_mode & ~0o200 if read_only else current_mode | 0o200
+
+    # Skip the chmod when the file is already in the requested state
+    if new_mode != current_mode:
+        os.chmod(path, new_mode)
+
+
 class ClairObscurConfig:
     """Manage Engine.ini configurations for Clair Obscur: Expedition 33."""
 
     def __init__(self, config_path: Path | None = None, game_version: str = "steam"):
         """Initialize with game version specific config path or custom path."""
-        # Load configuration from TOML file
-        with open(Path(__file__).parent.parent / "config.toml", "rb") as f:
-            self.toml_config = tomllib.load(f)
-
-        if config_path:
-            self.config_path = Path(config_path)
-        else:
-            home = Path.home()
-            if game_version == "gamepass":
-                # GamePass path
-                self.config_path = home / self.toml_config["paths"]["gamepass_path"]
-            else:
-                # Default Steam Proton path
-                self.config_path = home / self.toml_config["paths"]["steam_path"]
+        # Load configuration from TOML file (parsed once and shared between instances)
+        self.toml_config = _load_toml_config()
+
+        self.switch_version(game_version, config_path)
 
+    def switch_version(self, game_version: str, config_path: Path | None = None) -> None:
+        """Point the manager at the config directory for a game version or custom path."""
+        self.config_path = resolve_config_path(game_version, config_path)
         self.engine_ini_path = self.config_path / "Engine.ini"
 
-        # Ensure config directory exists
-        self.config_path.mkdir(parents=True, exist_ok=True)
+        # Ensure config directory exists; a single stat covers the common case
+        try:
+            os.stat(self.config_path)
+        except FileNotFoundError:
+            self.config_path.mkdir(parents=True, exist_ok=True)
 
-    def get_performance_preset(self, preset: str = "balanced") -> dict[str, dict[str, Any]]:
+    def get_performance_preset(self, preset: str = "balanced") -> Mapping[str, Mapping[str, Any]]:
         """Get predefined performance presets from TOML config."""
-        return self.toml_config["presets"].get(preset, self.toml_config["presets"]["balanced"])
+        return _preset(preset)
 
-    def get_engine_tweaks(self) -> dict[str, dict[str, Any]]:
+    def get_engine_tweaks(self) -> Mapping[str, Mapping[str, Any]]:
         """Additional engine tweaks for better performance from TOML config."""
-        return self.toml_config["engine_tweaks"]
+        return _engine_tweaks()
 
-    def backup_existing_config(self) -> Path | None:
+    def backup_existing_config(self) -> Backup | None:
         """Create a backup of existing Engine.ini if it exists."""
-        if self.engine_ini_path.exists():
-            backup_path = self.engine_ini_path.with_suffix(".ini.backup")
-            shutil.copy2(self.engine_ini_path, backup_path)
-            return backup_path
-        return None
+        if not self.engine_ini_path.exists():
+            return None
+
+        backup_path = self.engine_ini_path.with_suffix(".ini.backup")
+
+        # Compare contents rather than mtimes, which can tie on coarse-timestamp filesystems (FAT, SMB)
+        with contextlib.suppress(FileNotFoundError):
+            if backup_path.read_bytes() == self.engine_ini_path.read_bytes():
+                return Backup(backup_path, created=False)
+
+        _snapshot(self.engine_ini_path, backup_path)
+        return Backup(backup_path, created=True)
 
     def create_engine_ini(self, preset: str = "balanced", include_tweaks: bool = True) -> None:
         """Create Engine.ini with specified preset and tweaks."""
-        config = configparser.ConfigParser()
-        config.optionxform = str  # Preserve case sensitivity
-
-        # Add preset settings
-        preset_config = self.get_performance_preset(preset)
-        for section, settings in preset_config.items():
-            config[section] = {}
-            for key, value in settings.items():
-                config[section][key] = str(value)
+        # Add preset settings (copied, since the cached values are shared)
+        config = {section: dict(settings) for section, settings in _preset_strings(preset).items()}
 
         # Add engine tweaks if requested
         if include_tweaks:
-            tweak_config = self.get_engine_tweaks()
-            for section, settings in tweak_config.items():
-                if section not in config:
-                    config[section] = {}
-                for key, value in settings.items():
-                    config[section][key] = str(value)
+            for section, settings in _engine_tweak_strings().items():
+                config.setdefault(section, {}).update(settings)
 
         # Write config file
-        with open(self.engine_ini_path, 'w') as f:
-            config.write(f)
+        self._write_config(config)
 
     def apply_custom_settings(self, custom_settings: dict[str, dict[str, Any]]) -> None:
         """Apply custom settings to existing Engine.ini."""
-        config = configparser.ConfigParser()
-        config.optionxform = str
+        self._write_config(self._merge_custom_settings(custom_settings))
+
+    def has_changes(self, custom_settings: dict[str, dict[str, Any]]) -> bool:
+        """Check whether applying custom settings would change Engine.ini on disk."""
+        payload = fast_ini.dump(self._merge_custom_settings(custom_settings)).encode()
+        try:
+            return self.engine_ini_path.read_bytes() != payload
+        except FileNotFoundError:
+            return True
 
+    def _merge_custom_settings(self, custom_settings: dict[str, dict[str, Any]]) -> dict[str, dict[str, str]]:
+        """Return the existing Engine.ini settings with custom settings merged over them."""
         # Read existing config if it exists
-        if self.engine_ini_path.exists():
-            config.read(self.engine_ini_path)
+        config = self.read_config()
 
         # Apply custom settings
         for section, settings in custom_settings.items():
-            if section not in config:
-                config[section] = {}
-            for key, value in settings.items():
-                config[section][key] = str(value)
+            config.setdefault(section, {}).update((key, str(value)) for key, value in settings.items())
+        return config
 
-        # Write updated config
-        with open(self.engine_ini_path, 'w') as f:
-            config.write(f)
+    def _write_config(self, config: dict[str, dict[str, str]]) -> None:
+        """Write Engine.ini in a single syscall via a temp file swapped into place."""
+        payload = memoryview(fast_ini.dump(config).encode())
+
+        # Write through a symlinked Engine.ini to its target instead of replacing the link
+        target = self.engine_ini_path.resolve()
+        tmp_path = target.with_name(target.name + ".tmp")
+
+        # Permissions to carry over (e.g. read-only), or None when Engine.ini does not exist yet
+        try:
+            mode = stat.S_IMODE(os.stat(target).st_mode)
+        except FileNotFoundError:
+            mode = None
+
+        # Saves from this tool replace a read-only Engine.ini on purpose: the flag guards against the game
+        # overwriting our settings. POSIX renames over it regardless; Windows refuses to replace a read-only
+        # file, so lift the flag for the swap there.
+        unlock = os.name == "nt" and mode is not None and not mode & stat.S_IWRITE
+
+        fd = os.open(tmp_path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC | getattr(os, "O_BINARY", 0), 0o644)
+        try:
+            try:
+                while payload:
+                    payload = payload[os.write(fd, payload) :]
+            finally:
+                os.close(fd)
+
+            if unlock:
+                os.chmod(target, mode | stat.S_IWRITE)
+            os.replace(tmp_path, target)
+        except BaseException:
+            # Cleanup must not mask the original error
+            with contextlib.suppress(OSError):
+                tmp_path.unlink(missing_ok=True)
+            if unlock:
+                with contextlib.suppress(OSError):
+                    os.chmod(target, mode)
+            raise
+
+        # Restore the previous permissions on the new file, so a read-only Engine.ini stays read-only
+        if mode is not None:
+            os.chmod(target, mode)
 
     def set_read_only(self, read_only: bool = True) -> None:
         """Set Engine.ini as read-only to prevent game from overwriting."""
-        if self.engine_ini_path.exists():
-            current_stat = self.engine_ini_path.stat()
-            if read_only:
-                # Remove write permissions
-                self.engine_ini_path.chmod(current_stat.st_mode & ~0o200)
-            else:
-                # Add write permissions
-                self.engine_ini_path.chmod(current_stat.st_mode | 0o200)
-
-    def read_config(self) -> configparser.ConfigParser:
+        set_file_read_only(self.engine_ini_path, read_only)
+
+    def _read_engine_ini(self) -> str:
+        """Read Engine.ini in one call, dropping a UTF-8 byte order mark if an editor added one."""
+        return self.engine_ini_path.read_bytes().decode("utf-8-sig")
+
+    def read_config(self) -> dict[str, dict[str, str]]:
         """Read and return current Engine.ini configuration."""
-        config = configparser.ConfigParser()
-        config.optionxform = str
-        if self.engine_ini_path.exists():
-            config.read(self.engine_ini_path)
-        return config
+        try:
+            text = self._read_engine_ini()
+        except FileNotFoundError:
+            return {}
+        return fast_ini.parse(text)
 
-    def show_current_config(self) -> None:
-        """Display current Engine.ini configuration."""
-        if not self.engine_ini_path.exists():
-            print("Engine.ini does not exist")
-            return
+    def format_current_config(self) -> str:
+        """Render the current Engine.ini configuration as display text."""
+        try:
+            config = fast_ini.parse(self._read_engine_ini())
+        except FileNotFoundError:
+            return "Engine.ini does not exist\n"
 
-        config = configparser.ConfigParser()
-        config.optionxform = str
-        config.read(self.engine_ini_path)
+        parts = [f"Current Engine.ini configuration ({self.engine_ini_path}):", "=" * 60]
+        for section, settings in config.items():
+            parts.append(f"\n[{section}]")
+            parts.extend(f"{key}={value}" for key, value in settings.items())
 
-        print(f"Current Engine.ini configuration ({self.engine_ini_path}):")
-        print("=" * 60)
+        return "\n".join(parts) + "\n"
 
-        for section in config.sections():
-            print(f"\n[{section}]")
-            for key, value in config[section].items():
-                print(f"{key}={value}")
+    def show_current_config(self) -> None:
+        """Display current Engine.ini configuration."""
+        sys.stdout.write(self.format_current_config())
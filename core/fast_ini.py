@@ -0,0 +1,71 @@
+#!/usr/bin/env python
+
+"""
+Lightweight INI reader/writer for Engine.ini files.
+Covers the flat [section] / key=value layout Unreal uses without configparser overhead.
+"""
+
+
+def parse(text: str) -> dict[str, dict[str, str]]:
+    """Parse INI text into a {section: {key: value}} dict, preserving key case.
+
+    Raises ValueError on a key repeated within a section, as configparser does.
+    """
+    lines = text.splitlines()
+
+    # Indented lines are multi-line value continuations, which only configparser understands
+    if any(line[:1].isspace() and line.strip() for line in lines):
+        return _parse_with_configparser(text)
+
+    data: dict[str, dict[str, str]] = {}
+    section = None
+    for line in lines:
+        line = line.strip()
+        if not line or line[0] in "#;":
+            continue
+
+        if line[0] == "[" and line[-1] == "]":
+            section_name = line[1:-1]
+            section = data.setdefault(section_name, {})
+            continue
+
+        key, sep, value = line.partition("=")
+        key = key.rstrip()
+        if sep and key and section is not None:
+            # Repeated keys (e.g. several Paths= lines) cannot round-trip through a dict, so refuse them
+            if key in section:
+                raise ValueError(f"Malformed Engine.ini: option {key!r} in section {section_name!r} already exists")
+            section[key] = value.lstrip()
+
+    return data
+
+
+def dump(data: dict[str, dict[str, str]]) -> str:
+    """Serialize a {section: {key: value}} dict to INI text."""
+    return (
+        "\n\n".join(
+            f"[{section}]\n" + "\n".join(f"{key}={_format_value(value)}" for key, value in settings.items())
+            for section, settings in data.items()
+        )
+        + "\n"
+    )
+
+
+def _format_value(value: str) -> str:
+    """Indent continuation lines like configparser.write, so multi-line values survive a re-read."""
+    return str(value).replace("\n", "\n\t")
+
+
+def _parse_with_configparser(text: str) -> dict[str, dict[str, str]]:
+    """Fallback parser for files using configparser-only syntax."""
+    import configparser
+
+    # Engine.ini has no %(name)s references; strict mode rejects repeated keys like parse() does
+    config = configparser.ConfigParser(interpolation=None, strict=True)
+    config.optionxform = str  # Preserve case sensitivity
+    try:
+        config.read_string(text)
+    except configparser.Error as e:
+        # Surface malformed files as ValueError so callers need not import configparser
+        raise ValueError(f"Malformed Engine.ini: {e}") from e
+    return {section: dict(config[section]) for section in config.sections()}
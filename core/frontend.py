@@ -2,53 +2,195 @@
 
 import attrs
 import flet as ft
+import functools
+from collections.abc import Callable
 from core.backend import ClairObscurConfig, get_version
 from decouple import config
 from pathlib import Path
+from types import MappingProxyType
+from typing import Any
 
+_THEME_MODE_MAP = MappingProxyType({"DARK": ft.ThemeMode.DARK, "LIGHT": ft.ThemeMode.LIGHT, "SYSTEM": ft.ThemeMode.SYSTEM})
 
-@attrs.define
+
+@functools.cache
+def _cfg(key: str, default, cast=str):
+    """Read a decouple setting once per process."""
+    return config(key, default=default, cast=cast)
+
+
+@attrs.define(slots=True, frozen=True, cache_hash=True)
 class ThemeConfig:
     """Theme configuration using attrs and decouple."""
 
     # Theme mode from environment or default to DARK
-    mode: str = attrs.field(factory=lambda: config("THEME_MODE", default="DARK"))
+    mode: str = attrs.field(factory=lambda: _cfg("THEME_MODE", "DARK"), converter=str.upper)
 
     # Window dimensions from environment with defaults - optimized for nearest neighbor scaling
-    height: int = attrs.field(factory=lambda: config("GUI_HEIGHT", default=1075, cast=int))
+    height: int = attrs.field(factory=lambda: _cfg("GUI_HEIGHT", 1075, int))
 
-    width: int = attrs.field(factory=lambda: config("GUI_WIDTH", default=1100, cast=int))
+    width: int = attrs.field(factory=lambda: _cfg("GUI_WIDTH", 1100, int))
 
     # TODO: set to false
     # Window resizable setting
-    resizable: bool = attrs.field(factory=lambda: config("GUI_RESIZABLE", default=True, cast=bool))
+    resizable: bool = attrs.field(factory=lambda: _cfg("GUI_RESIZABLE", True, bool))
 
     # App title from environment with default
-    title: str = attrs.field(factory=lambda: config("APP_TITLE", default="Clair Obscur: Expedition 33 - Unreal Config"))
+    title: str = attrs.field(factory=lambda: _cfg("APP_TITLE", "Clair Obscur: Expedition 33 - Unreal Config"))
 
     def get_flet_theme_mode(self) -> ft.ThemeMode:
         """Convert string theme mode to Flet ThemeMode enum."""
-        theme_map = {"DARK": ft.ThemeMode.DARK, "LIGHT": ft.ThemeMode.LIGHT, "SYSTEM": ft.ThemeMode.SYSTEM}
-        return theme_map.get(self.mode.upper(), ft.ThemeMode.DARK)
+        return _THEME_MODE_MAP.get(self.mode, ft.ThemeMode.DARK)
+
+    def toggle_mode(self) -> "ThemeConfig":
+        """Return a copy switched between light and dark mode."""
+        return attrs.evolve(self, mode="LIGHT" if self.mode == "DARK" else "DARK")
+
+
+# Legacy constants for backward compatibility, resolved on first access via __getattr__
+_LEGACY_SETTINGS = {
+    "THEME": ("THEME", "DARK", str),
+    "GUI_WIDTH": ("GUI_WIDTH", 1200, int),
+    "GUI_HEIGHT": ("GUI_HEIGHT", 800, int),
+}
+
+
+def __getattr__(name: str):
+    """Resolve legacy module constants lazily (PEP 562)."""
+    if name in _LEGACY_SETTINGS:
+        return _cfg(*_LEGACY_SETTINGS[name])
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+# Map UI controls to config keys
+_CONFIG_MAP = {
+    "Anisotropic Filtering": ("SystemSettings", "r.MaxAnisotropy"),
+    "Depth of Field": ("SystemSettings", "r.DepthOfFieldQuality"),
+    "Bloom": ("SystemSettings", "r.BloomQuality"),
+    "Motion Blur": ("SystemSettings", "r.MotionBlurQuality"),
+    "Lens Flares": ("SystemSettings", "r.LensFlareQuality"),
+    "Shadow Quality": ("SystemSettings", "r.ShadowQuality"),
+    "Shadow Resolution": ("SystemSettings", "r.Shadow.MaxResolution"),
+    "Film Grain": ("SystemSettings", "r.FilmGrain"),
+    "Fog": ("SystemSettings", "r.Fog"),
+    "Volumetric Fog": ("SystemSettings", "r.VolumetricFog"),
+    "Chromatic Aberration": ("SystemSettings", "r.SceneColorFringeQuality"),
+    "Sharpening Strength": ("SystemSettings", "r.Tonemapper.Sharpen"),
+    "View Distance": ("SystemSettings", "r.ViewDistanceScale"),
+    "Shadow Distance": ("SystemSettings", "r.Shadow.DistanceScale"),
+    "Foliage Distance": ("SystemSettings", "r.Foliage.LODDistanceScale"),
+}
+
+# Convert dropdown values to config values
+_QUALITY_TO_CODE = MappingProxyType(
+    {"Disabled": "0", "Low": "1", "Medium": "2", "High": "3", "Very High": "4", "Ultra": "5", "Enabled": "1"}
+)
+_ANISO_TO_CODE = MappingProxyType({"Disabled": "0", "2x": "2", "4x": "4", "8x": "8", "16x": "16", "Enabled": "1"})
+
+# Dropdowns whose labels need their own code map; everything else uses _QUALITY_TO_CODE
+_CODE_MAPS = MappingProxyType({"Anisotropic Filtering": _ANISO_TO_CODE})
+
+# Dropdown choices
+_QUALITY = ("Disabled", "Low", "Medium", "High", "Very High", "Ultra")
+_SHADOW = ("Low", "Medium", "High", "Ultra")
+_ANISO = ("Disabled", "2x", "4x", "8x", "16x")
+_SHADOW_RES = ("4096x4096", "2048x2048", "1024x1024")
+_ONOFF = ("Disabled", "Enabled")
+
+
+def _aniso(value) -> str:
+    """Convert r.MaxAnisotropy to a dropdown label."""
+    return f"{value}x" if int(value) else "Disabled"
+
+
+def _quality(value) -> str:
+    """Convert a 0-5 quality level to a dropdown label."""
+    return _QUALITY[min(int(value), 5)]
+
+
+def _shadow(value) -> str:
+    """Convert a 0-3 shadow quality level to a dropdown label."""
+    return _SHADOW[min(int(value), 3)]
+
+
+def _enabled(value) -> str:
+    """Convert a 0/1 flag to Disabled/Enabled."""
+    return "Enabled" if int(value) else "Disabled"
+
+
+def _true_false(value) -> bool:
+    """Convert a True/False config string to a switch value."""
+    return str(value).lower() == "true"
+
+
+# Map preset config keys to UI controls and the converter for their value
+_PRESET_MAPPINGS: dict[str, tuple[str, Callable[[Any], Any]]] = {
+    "r.MaxAnisotropy": ("Anisotropic Filtering", _aniso),
+    "r.DepthOfFieldQuality": ("Depth of Field", _quality),
+    "r.BloomQuality": ("Bloom", _quality),
+    "r.MotionBlurQuality": ("Motion Blur", _quality),
+    "r.LensFlareQuality": ("Lens Flares", _quality),
+    "r.ShadowQuality": ("Shadow Quality", _shadow),
+    "r.FilmGrain": ("Film Grain", _enabled),
+    "r.Fog": ("Fog", _true_false),
+    "r.VolumetricFog": ("Volumetric Fog", _true_false),
+    "r.ViewDistanceScale": ("View Distance", float),
+    "r.Tonemapper.Sharpen": ("Sharpening Strength", float),
+}
+
+# Preset buttons as (label, preset name, color), listed row by row for the two-column grid
+_PRESET_BUTTONS = (
+    ("Low", "low", ft.Colors.RED_700),
+    ("Sharp &\nClear", "sharp_clear", ft.Colors.BLUE_700),
+    ("Balanced", "balanced", ft.Colors.ORANGE_700),
+    ("Soft &\nAmbient", "soft_ambient", ft.Colors.PURPLE_700),
+    ("Ultra", "ultra", ft.Colors.GREEN_700),
+    ("Custom", "custom", ft.Colors.GREY_700),
+)
 
-    def toggle_mode(self) -> str:
-        """Toggle between light and dark mode and return new mode."""
-        if self.mode.upper() == "DARK":
-            self.mode = "LIGHT"
-        else:
-            self.mode = "DARK"
-        return self.mode
 
+def _dropdown_value(label: str, control: ft.Dropdown) -> str:
+    """Convert a dropdown selection to its config value."""
+    return _CODE_MAPS.get(label, _QUALITY_TO_CODE).get(control.value, control.value)
 
-# Legacy constants for backward compatibility
-THEME = config("THEME", default="DARK")
-GUI_WIDTH = config("GUI_WIDTH", default=1200, cast=int)
-GUI_HEIGHT = config("GUI_HEIGHT", default=800, cast=int)
+
+def _slider_value(label: str, control: ft.Slider) -> str:
+    """Convert a slider position to its config value."""
+    return str(control.value)
+
+
+# Switches written as True/False rather than 1/0
+_TRUE_FALSE_SWITCHES = frozenset({"Fog", "Volumetric Fog"})
+
+
+def _switch_value(label: str, control: ft.Switch) -> str:
+    """Convert a switch state to True/False for fog toggles and 1/0 otherwise."""
+    if label in _TRUE_FALSE_SWITCHES:
+        return "True" if control.value else "False"
+    return "1" if control.value else "0"
+
+
+# Convert UI control values to config values, dispatched on the control type
+_GATHER = {ft.Dropdown: _dropdown_value, ft.Slider: _slider_value, ft.Switch: _switch_value}
 
 
 class ClairConfigFlet:
     """Main Flet application for Clair Obscur configuration."""
 
+    __slots__ = (
+        "game_version",
+        "custom_config_path",
+        "config_manager",
+        "include_tweaks",
+        "page",
+        "theme_config",
+        "game_version_radio",
+        "preset_buttons",
+        "config_controls",
+        "_snackbar",
+        "_layout",
+    )
+
     def __init__(self, config_path: Path | None = None, game_version: str = "steam"):
         self.game_version = game_version
         self.custom_config_path = config_path
@@ -63,11 +205,13 @@ class ClairConfigFlet:
         self.game_version_radio = None
         self.preset_buttons = {}
         self.config_controls = {}
+        self._snackbar = None
+        self._layout = None
 
     def update_game_version(self, version: str) -> None:
-        """Update game version and recreate config manager with correct paths."""
+        """Update game version and repoint the config manager at its paths."""
         self.game_version = version
-        self.config_manager = ClairObscurConfig(config_path=self.custom_config_path, game_version=version)
+        self.config_manager.switch_version(version, self.custom_config_path)
 
     def main(self, page: ft.Page):
         """Main Flet app entry point."""
@@ -78,56 +222,73 @@ class ClairConfigFlet:
         page.window.height = self.theme_config.height
         page.window.resizable = self.theme_config.resizable
 
-        # Create the main layout inspired by the game's interface
+        # Single snackbar reused by every notification
+        self._snackbar = ft.SnackBar(content=ft.Text(""))
+        page.overlay.append(self._snackbar)
+
+        # Paint the header first, then build the configuration sections off the UI thread
         page.add(self.build_ui())
+        page.run_thread(self.populate_ui)
 
     def build_ui(self) -> ft.Container:
-        """Build the main UI inspired by the game interface."""
+        """Build the main UI shell: the header and a loading indicator until populate_ui runs."""
+        self._layout = ft.Column(
+            [
+                # Header section - compact
+                self.build_header(),
+                ft.Row([ft.ProgressRing()], alignment=ft.MainAxisAlignment.CENTER),
+            ],
+            spacing=5,
+        )
         return ft.Container(
-            content=ft.Column(
+            content=self._layout,
+            bgcolor=ft.Colors.BLUE_GREY_900,
+            expand=True,
+        )
+
+    def populate_ui(self) -> None:
+        """Replace the loading indicator with the configuration sections and button bar."""
+        self._layout.controls[1:] = self.build_sections()
+        self.page.update(self._layout)
+
+    def build_sections(self) -> list[ft.Control]:
+        """Build everything below the header, inspired by the game interface."""
+        return [
+            # Main content area - tight layout at top
+            ft.Row(
                 [
-                    # Header section - compact
-                    self.build_header(),
-                    # Main content area - tight layout at top
-                    ft.Row(
-                        [
-                            # Left column - Game Version & Graphics
-                            ft.Container(
-                                content=ft.Column(
-                                    [
-                                        self.build_game_version_section(),
-                                        self.build_graphics_section(),
-                                    ],
-                                    tight=True,
-                                ),
-                                width=420,
-                                padding=ft.padding.all(10),
-                            ),
-                            # Right column - Presets & Advanced Options
-                            ft.Container(
-                                content=ft.Column(
-                                    [
-                                        self.build_preset_section(),
-                                        self.build_advanced_section(),
-                                    ],
-                                    tight=True,
-                                ),
-                                width=640,
-                                padding=ft.padding.all(10),
-                            ),
-                        ],
-                        alignment=ft.MainAxisAlignment.CENTER,
-                        vertical_alignment=ft.CrossAxisAlignment.START,
+                    # Left column - Game Version & Graphics
+                    ft.Container(
+                        content=ft.Column(
+                            [
+                                self.build_game_version_section(),
+                                self.build_graphics_section(),
+                            ],
+                            tight=True,
+                        ),
+                        width=420,
+                        padding=ft.padding.all(10),
+                    ),
+                    # Right column - Presets & Advanced Options
+                    ft.Container(
+                        content=ft.Column(
+                            [
+                                self.build_preset_section(),
+                                self.build_advanced_section(),
+                            ],
+                            tight=True,
+                        ),
+                        width=640,
+                        padding=ft.padding.all(10),
                     ),
-                    # Bottom button bar - positioned at bottom
-                    ft.Container(expand=True),  # Flexible spacer
-                    self.build_button_bar(),
                 ],
-                spacing=5,
+                alignment=ft.MainAxisAlignment.CENTER,
+                vertical_alignment=ft.CrossAxisAlignment.START,
             ),
-            bgcolor=ft.Colors.BLUE_GREY_900,
-            expand=True,
-        )
+            # Bottom button bar - positioned at bottom
+            ft.Container(expand=True),  # Flexible spacer
+            self.build_button_bar(),
+        ]
 
     def build_header(self) -> ft.Container:
         """Build the header section similar to the game's title area."""
@@ -190,14 +351,14 @@ class ClairConfigFlet:
     def build_graphics_section(self) -> ft.Container:
         """Build graphics configuration section."""
         graphics_controls = [
-            self.create_dropdown_option("Anisotropic Filtering", ["Disabled", "2x", "4x", "8x", "16x"], "Enabled"),
-            self.create_dropdown_option("Depth of Field", ["Disabled", "Low", "Medium", "High", "Very High", "Ultra"], "Ultra"),
-            self.create_dropdown_option("Bloom", ["Disabled", "Low", "Medium", "High", "Very High", "Ultra"], "Very High"),
-            self.create_dropdown_option("Motion Blur", ["Disabled", "Low", "Medium", "High", "Very High", "Ultra"], "High"),
-            self.create_dropdown_option("Lens Flares", ["Disabled", "Low", "Medium", "High", "Very High", "Ultra"], "High"),
-            self.create_dropdown_option("Shadow Quality", ["Low", "Medium", "High", "Ultra"], "Ultra"),
-            self.create_dropdown_option("Shadow Resolution", ["4096x4096", "2048x2048", "1024x1024"], "4096x4096"),
-            self.create_dropdown_option("Film Grain", ["Disabled", "Enabled"], "Enabled"),
+            self.create_dropdown_option("Anisotropic Filtering", _ANISO, "Enabled"),
+            self.create_dropdown_option("Depth of Field", _QUALITY, "Ultra"),
+            self.create_dropdown_option("Bloom", _QUALITY, "Very High"),
+            self.create_dropdown_option("Motion Blur", _QUALITY, "High"),
+            self.create_dropdown_option("Lens Flares", _QUALITY, "High"),
+            self.create_dropdown_option("Shadow Quality", _SHADOW, "Ultra"),
+            self.create_dropdown_option("Shadow Resolution", _SHADOW_RES, "4096x4096"),
+            self.create_dropdown_option("Film Grain", _ONOFF, "Enabled"),
         ]
 
         return ft.Container(
@@ -217,98 +378,21 @@ class ClairConfigFlet:
 
     def build_preset_section(self) -> ft.Container:
         """Build performance presets section."""
-        preset_buttons = [
-            ft.Container(
-                content=ft.ElevatedButton(
-                    text="Low",
-                    on_click=lambda _: self.apply_preset("low"),
-                    style=ft.ButtonStyle(
-                        bgcolor={ft.ControlState.DEFAULT: ft.Colors.RED_700},
-                        color=ft.Colors.WHITE,
-                    ),
-                    width=110,
-                    height=40,
-                ),
-                margin=ft.margin.all(3),
-            ),
-            ft.Container(
-                content=ft.ElevatedButton(
-                    text="Balanced",
-                    on_click=lambda _: self.apply_preset("balanced"),
-                    style=ft.ButtonStyle(
-                        bgcolor={ft.ControlState.DEFAULT: ft.Colors.ORANGE_700},
-                        color=ft.Colors.WHITE,
-                    ),
-                    width=110,
-                    height=40,
-                ),
-                margin=ft.margin.all(3),
-            ),
-            ft.Container(
-                content=ft.ElevatedButton(
-                    text="Ultra",
-                    on_click=lambda _: self.apply_preset("ultra"),
-                    style=ft.ButtonStyle(
-                        bgcolor={ft.ControlState.DEFAULT: ft.Colors.GREEN_700},
-                        color=ft.Colors.WHITE,
-                    ),
-                    width=110,
-                    height=40,
-                ),
-                margin=ft.margin.all(3),
-            ),
-            ft.Container(
-                content=ft.ElevatedButton(
-                    content=ft.Text("Sharp &\nClear", text_align=ft.TextAlign.CENTER, size=12, color=ft.Colors.WHITE),
-                    on_click=lambda _: self.apply_preset("sharp_clear"),
-                    style=ft.ButtonStyle(
-                        bgcolor={ft.ControlState.DEFAULT: ft.Colors.BLUE_700},
-                        color=ft.Colors.WHITE,
-                    ),
-                    width=110,
-                    height=40,
-                ),
-                margin=ft.margin.all(3),
-            ),
-            ft.Container(
-                content=ft.ElevatedButton(
-                    content=ft.Text("Soft &\nAmbient", text_align=ft.TextAlign.CENTER, size=12, color=ft.Colors.WHITE),
-                    on_click=lambda _: self.apply_preset("soft_ambient"),
-                    style=ft.ButtonStyle(
-                        bgcolor={ft.ControlState.DEFAULT: ft.Colors.PURPLE_700},
-                        color=ft.Colors.WHITE,
-                    ),
-                    width=110,
-                    height=40,
-                ),
-                margin=ft.margin.all(3),
-            ),
-            ft.Container(
-                content=ft.ElevatedButton(
-                    text="Custom",
-                    on_click=lambda _: self.apply_preset("custom"),
-                    style=ft.ButtonStyle(
-                        bgcolor={ft.ControlState.DEFAULT: ft.Colors.GREY_700},
-                        color=ft.Colors.WHITE,
-                    ),
-                    width=110,
-                    height=40,
-                ),
-                margin=ft.margin.all(3),
-            ),
-        ]
+        preset_buttons = [self.create_preset_button(*spec) for spec in _PRESET_BUTTONS]
 
         return ft.Container(
             content=ft.Column(
                 [
                     ft.Text("Performance Presets", size=16, weight=ft.FontWeight.BOLD, color=ft.Colors.WHITE),
                     ft.Divider(color=ft.Colors.WHITE24, height=1),
-                    ft.Row(
-                        [
-                            ft.Column([preset_buttons[0], preset_buttons[1], preset_buttons[2]], spacing=5),
-                            ft.Column([preset_buttons[3], preset_buttons[4], preset_buttons[5]], spacing=5),
-                        ],
-                        alignment=ft.MainAxisAlignment.SPACE_AROUND,
+                    # Fixed height fits three ~41px rows at the right column's 596px content width
+                    ft.GridView(
+                        controls=preset_buttons,
+                        runs_count=2,
+                        child_aspect_ratio=7,
+                        spacing=8,
+                        run_spacing=20,
+                        height=140,
                     ),
                 ],
                 tight=True,
@@ -430,7 +514,30 @@ class ClairConfigFlet:
             bgcolor=ft.Colors.BLACK54,
         )
 
-    def create_dropdown_option(self, label: str, options: list, default: str) -> ft.Container:
+    def create_preset_button(self, label: str, preset_name: str, color: ft.Colors) -> ft.ElevatedButton:
+        """Create a color-coded preset button."""
+        if "\n" in label:
+            # Two-line labels need an explicit centered Text
+            content = ft.Text(label, text_align=ft.TextAlign.CENTER, size=12, color=ft.Colors.WHITE)
+            text = None
+        else:
+            content = None
+            text = label
+
+        button = ft.ElevatedButton(
+            text=text,
+            content=content,
+            on_click=lambda _: self.apply_preset(preset_name),
+            style=ft.ButtonStyle(
+                bgcolor={ft.ControlState.DEFAULT: color},
+                color=ft.Colors.WHITE,
+            ),
+        )
+        self.preset_buttons[preset_name] = button
+
+        return button
+
+    def create_dropdown_option(self, label: str, options: tuple[str, ...], default: str) -> ft.Container:
         """Create a dropdown configuration option."""
         dropdown = ft.Dropdown(
             options=[ft.dropdown.Option(opt) for opt in options],
@@ -454,16 +561,19 @@ class ClairConfigFlet:
         """Create a slider configuration option."""
         slider_text = ft.Text(str(default), size=14, color=ft.Colors.WHITE, width=50)
 
-        def on_change(e):
+        def on_change_end(e):
             slider_text.value = str(round(e.control.value, 2))
-            self.page.update()
+            self.page.update(slider_text)
 
+        # The value bubble tracks the drag client-side; the readout is only pushed once the drag ends
         slider = ft.Slider(
             min=min_val,
             max=max_val,
             value=default,
             divisions=int((max_val - min_val) / step),
-            on_change=on_change,
+            label="{value}",
+            round=2,
+            on_change_end=on_change_end,
             width=200,
         )
 
@@ -509,42 +619,19 @@ class ClairConfigFlet:
             system_settings = preset_config.get("SystemSettings", {})
 
             # Update UI controls with preset values
-            mappings = {
-                "r.MaxAnisotropy": ("Anisotropic Filtering", lambda x: f"{x}x" if x != "0" else "Disabled"),
-                "r.DepthOfFieldQuality": (
-                    "Depth of Field",
-                    lambda x: ["Disabled", "Low", "Medium", "High", "Very High", "Ultra"][min(int(x), 5)],
-                ),
-                "r.BloomQuality": (
-                    "Bloom",
-                    lambda x: ["Disabled", "Low", "Medium", "High", "Very High", "Ultra"][min(int(x), 5)],
-                ),
-                "r.MotionBlurQuality": (
-                    "Motion Blur",
-                    lambda x: ["Disabled", "Low", "Medium", "High", "Very High", "Ultra"][min(int(x), 5)],
-                ),
-                "r.LensFlareQuality": (
-                    "Lens Flares",
-                    lambda x: ["Disabled", "Low", "Medium", "High", "Very High", "Ultra"][min(int(x), 5)],
-                ),
-                "r.ShadowQuality": ("Shadow Quality", lambda x: ["Low", "Medium", "High", "Ultra"][min(int(x), 3)]),
-                "r.FilmGrain": ("Film Grain", lambda x: "Enabled" if x != "0" else "Disabled"),
-                "r.Fog": ("Fog", lambda x: x.lower() == "true"),
-                "r.VolumetricFog": ("Volumetric Fog", lambda x: x.lower() == "true"),
-                "r.ViewDistanceScale": ("View Distance", lambda x: float(x)),
-                "r.Tonemapper.Sharpen": ("Sharpening Strength", lambda x: float(x)),
-            }
-
-            for config_key, (ui_label, converter) in mappings.items():
-                if config_key in system_settings and ui_label in self.config_controls:
-                    value = system_settings[config_key]
-                    converted_value = converter(value)
-                    control = self.config_controls[ui_label]
-
-                    if isinstance(control, ft.Dropdown | ft.Slider | ft.Switch):
-                        control.value = converted_value
-
-            self.page.update()
+            changed = []
+            for config_key in system_settings.keys() & _PRESET_MAPPINGS.keys():
+                ui_label, converter = _PRESET_MAPPINGS[config_key]
+                control = self.config_controls.get(ui_label)
+                if control is None:
+                    continue
+
+                control.value = converter(system_settings[config_key])
+                changed.append(control)
+
+            # Only send the controls that changed rather than diffing the whole page
+            if changed:
+                self.page.update(*changed)
             self.show_snackbar(f"{preset_name.title()} preset applied")
 
         except Exception as e:
@@ -554,57 +641,20 @@ class ClairConfigFlet:
         """Gather all configuration values from UI controls."""
         settings = {"SystemSettings": {}, "/Script/Engine.RendererSettings": {}}
 
-        # Map UI controls to config keys
-        config_map = {
-            "Anisotropic Filtering": ("SystemSettings", "r.MaxAnisotropy"),
-            "Depth of Field": ("SystemSettings", "r.DepthOfFieldQuality"),
-            "Bloom": ("SystemSettings", "r.BloomQuality"),
-            "Motion Blur": ("SystemSettings", "r.MotionBlurQuality"),
-            "Lens Flares": ("SystemSettings", "r.LensFlareQuality"),
-            "Shadow Quality": ("SystemSettings", "r.ShadowQuality"),
-            "Shadow Resolution": ("SystemSettings", "r.Shadow.MaxResolution"),
-            "Film Grain": ("SystemSettings", "r.FilmGrain"),
-            "Fog": ("SystemSettings", "r.Fog"),
-            "Volumetric Fog": ("SystemSettings", "r.VolumetricFog"),
-            "Chromatic Aberration": ("SystemSettings", "r.SceneColorFringeQuality"),
-            "Sharpening Strength": ("SystemSettings", "r.Tonemapper.Sharpen"),
-            "View Distance": ("SystemSettings", "r.ViewDistanceScale"),
-            "Shadow Distance": ("SystemSettings", "r.Shadow.DistanceScale"),
-            "Foliage Distance": ("SystemSettings", "r.Foliage.LODDistanceScale"),
-        }
-
-        for ui_label, (section, key) in config_map.items():
-            if ui_label in self.config_controls:
-                control = self.config_controls[ui_label]
-
-                if isinstance(control, ft.Dropdown):
-                    value = control.value
-                    # Convert UI values to config values
-                    quality_map = {
-                        "Disabled": "0",
-                        "Low": "1",
-                        "Medium": "2",
-                        "High": "3",
-                        "Very High": "4",
-                        "Ultra": "5",
-                        "2x": "2",
-                        "4x": "4",
-                        "8x": "8",
-                        "16x": "16",
-                        "Enabled": "1",
-                    }
-                    value = quality_map.get(value, value)
-                elif isinstance(control, ft.Slider):
-                    value = str(control.value)
-                elif isinstance(control, ft.Switch):
-                    if ui_label in ["Fog", "Volumetric Fog"]:
-                        value = "True" if control.value else "False"
-                    else:
-                        value = "1" if control.value else "0"
-                else:
-                    continue
+        # Bind the lookups used on every iteration to locals
+        get_control = self.config_controls.get
+        get_handler = _GATHER.get
+
+        for ui_label, (section, key) in _CONFIG_MAP.items():
+            control = get_control(ui_label)
+            if control is None:
+                continue
 
-                settings[section][key] = value
+            handler = get_handler(type(control))
+            if handler is None:
+                continue
+
+            settings[section][key] = handler(ui_label, control)
 
         return settings
 
@@ -613,24 +663,28 @@ class ClairConfigFlet:
         try:
             settings = self.gather_ui_values()
 
-            # Create backup
-            backup_path = self.config_manager.backup_existing_config()
-            if backup_path:
-                self.show_snackbar(f"Backup created: {backup_path.name}")
+            # Merge engine tweaks if enabled so Engine.ini is written once
+            if self.config_controls["Include Engine Tweaks"].value:
+                for section, tweaks in self.config_manager.get_engine_tweaks().items():
+                    settings.setdefault(section, {}).update(tweaks)
+
+            read_only = self.config_controls["Set Config Read-Only"].value
 
-            # Apply settings
-            self.config_manager.apply_custom_settings(settings)
+            # Only back up and rewrite Engine.ini when the settings differ from what is on disk
+            if self.config_manager.has_changes(settings):
+                # Create backup
+                backup = self.config_manager.backup_existing_config()
+                if backup and backup.created:
+                    self.show_snackbar(f"Backup created: {backup.path.name}")
 
-            # Add engine tweaks if enabled
-            if self.config_controls.get("Include Engine Tweaks", ft.Switch(value=True)).value:
-                tweaks = self.config_manager.get_engine_tweaks()
-                self.config_manager.apply_custom_settings(tweaks)
+                # Apply settings
+                self.config_manager.apply_custom_settings(settings)
+                message = "Configuration saved and set to read-only!" if read_only else "Configuration saved successfully!"
+            else:
+                message = "No changes to save; config set to read-only" if read_only else "No changes to save"
 
             # Set read-only if enabled
-            read_only = self.config_controls.get("Set Config Read-Only", ft.Switch(value=False)).value
             self.config_manager.set_read_only(read_only)
-
-            message = "Configuration saved and set to read-only!" if read_only else "Configuration saved successfully!"
             self.show_snackbar(message)
 
         except Exception as e:
@@ -655,19 +709,17 @@ class ClairConfigFlet:
 
     def toggle_theme(self, e):
         """Toggle between light and dark themes using attrs-based theme config."""
-        new_mode = self.theme_config.toggle_mode()
+        self.theme_config = self.theme_config.toggle_mode()
         self.page.theme_mode = self.theme_config.get_flet_theme_mode()
         self.page.update()
-        self.show_snackbar(f"Switched to {new_mode.lower()} theme")
+        self.show_snackbar(f"Switched to {self.theme_config.mode.lower()} theme")
 
     def show_snackbar(self, message: str, is_error: bool = False):
         """Show a snackbar notification."""
-        self.page.snack_bar = ft.SnackBar(
-            content=ft.Text(message),
-            bgcolor=ft.Colors.RED if is_error else ft.Colors.GREEN,
-        )
-        self.page.snack_bar.open = True
-        self.page.update()
+        self._snackbar.content.value = message
+        self._snackbar.bgcolor = ft.Colors.RED if is_error else ft.Colors.GREEN
+        self._snackbar.open = True
+        self.page.update(self._snackbar)
 
 
 def run_flet_app(config_path: Path | None = None, game_version: str = "steam"):
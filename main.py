@@ -8,24 +8,11 @@ Main orchestration layer for the terminal user interface / command line tool.
 
 import argparse
 import sys
-from core.backend import ClairObscurConfig
-from core.frontend import run_flet_app
 from pathlib import Path
 
 
-def main():
-    """Main CLI interface with Flet GUI and CLI modes."""
-    parser = argparse.ArgumentParser(description="Clair Obscur: Expedition 33 Configuration Tool")
-
-    parser.add_argument(
-        "--config-path", type=Path, help="Custom path to config directory (default: auto-detected based on game version)"
-    )
-
-    parser.add_argument("--game-version", choices=["steam", "gamepass"], default="steam", help="Game version (steam or gamepass)")
-
-    subparsers = parser.add_subparsers(dest="command", help="Available commands")
-
-    # Create command
+def _add_create_parser(subparsers) -> None:
+    """Register the create command."""
     create_parser = subparsers.add_parser("create", help="Create new Engine.ini")
     create_parser.add_argument(
         "--preset",
@@ -36,13 +23,19 @@ def main():
     create_parser.add_argument("--no-tweaks", action="store_true", help="Don't include additional engine tweaks")
     create_parser.add_argument("--read-only", action="store_true", help="Set Engine.ini as read-only after creation")
 
-    # Show command
+
+def _add_show_parser(subparsers) -> None:
+    """Register the show command."""
     subparsers.add_parser("show", help="Show current Engine.ini configuration")
 
-    # Backup command
+
+def _add_backup_parser(subparsers) -> None:
+    """Register the backup command."""
     subparsers.add_parser("backup", help="Create backup of current Engine.ini")
 
-    # Custom command
+
+def _add_custom_parser(subparsers) -> None:
+    """Register the custom command."""
     custom_parser = subparsers.add_parser("custom", help="Apply custom settings")
     custom_parser.add_argument("--section", required=True, help="Config section name")
     custom_parser.add_argument(
@@ -53,60 +46,195 @@ def main():
         help="Custom setting key-value pair (can be used multiple times)",
     )
 
-    # Read-only command
+
+def _add_readonly_parser(subparsers) -> None:
+    """Register the readonly command."""
     readonly_parser = subparsers.add_parser("readonly", help="Set read-only status")
     readonly_parser.add_argument("status", choices=["on", "off"], help="Enable or disable read-only mode")
 
-    args = parser.parse_args()
+
+# Subcommand parsers, built on demand so a plain GUI launch or a single command skips the rest
+COMMAND_BUILDERS = {
+    "create": _add_create_parser,
+    "show": _add_show_parser,
+    "backup": _add_backup_parser,
+    "custom": _add_custom_parser,
+    "readonly": _add_readonly_parser,
+}
+
+# Global options that consume the following argument
+_GLOBAL_VALUE_OPTIONS = frozenset({"--config-path", "--game-version"})
+
+
+def _builders_for(argv: list[str]) -> list:
+    """Return the subparser builders needed to parse argv."""
+    for prev, arg in zip([None, *argv], argv, strict=False):
+        if arg in ("-h", "--help"):
+            # Top-level help lists every command
+            return list(COMMAND_BUILDERS.values())
+        if arg.startswith("-") or prev in _GLOBAL_VALUE_OPTIONS:
+            continue
+
+        # Unknown commands need every parser registered so argparse can list the valid choices
+        builder = COMMAND_BUILDERS.get(arg)
+        return [builder] if builder else list(COMMAND_BUILDERS.values())
+
+    # No command means the GUI, which has no subcommand to parse
+    return []
+
+
+# Global option defaults, shared by the argparse tree and the fast path
+_DEFAULTS = {"config_path": None, "game_version": "steam"}
+
+# Option-free invocations that map straight to a namespace, skipping argparse entirely
+_FAST_COMMANDS = {
+    ("show",): {},
+    ("backup",): {},
+    ("readonly", "on"): {"status": "on"},
+    ("readonly", "off"): {"status": "off"},
+}
+
+
+def _fast_args(argv: list[str]) -> argparse.Namespace | None:
+    """Return the parsed arguments for a bare show/backup/readonly command, or None."""
+    extra = _FAST_COMMANDS.get(tuple(argv))
+    if extra is None:
+        return None
+    return argparse.Namespace(**_DEFAULTS, command=argv[0], **extra)
+
+
+class _CommandParser(argparse.ArgumentParser):
+    """Argument parser that reports errors against the full command list."""
+
+    # Set when only some subcommands were registered (see _builders_for)
+    partial = False
+
+    def error(self, message):
+        if self.partial:
+            # The usage line lists the commands, so report through a parser that has all of them
+            _build_parser(list(COMMAND_BUILDERS.values())).error(message)
+        super().error(message)
+
+
+def _build_parser(builders: list) -> argparse.ArgumentParser:
+    """Build the argument parser with the given subcommand builders."""
+    parser = _CommandParser(description="Clair Obscur: Expedition 33 Configuration Tool")
+
+    parser.add_argument(
+        "--config-path",
+        type=Path,
+        default=_DEFAULTS["config_path"],
+        help="Custom path to config directory (default: auto-detected based on game version)",
+    )
+
+    parser.add_argument(
+        "--game-version",
+        choices=["steam", "gamepass"],
+        default=_DEFAULTS["game_version"],
+        help="Game version (steam or gamepass)",
+    )
+
+    subparsers = parser.add_subparsers(dest="command", help="Available commands")
+    for build in builders:
+        build(subparsers)
+
+    parser.partial = len(builders) < len(COMMAND_BUILDERS)
+    return parser
+
+
+def _cmd_create(config_manager, preset: str, include_tweaks: bool, read_only: bool) -> None:
+    """Back up Engine.ini and write a fresh one from a preset."""
+    backup = config_manager.backup_existing_config()
+    if backup and backup.created:
+        print(f"Backup created: {backup.path}")
+
+    config_manager.create_engine_ini(preset=preset, include_tweaks=include_tweaks)
+    print(f"Engine.ini created: {config_manager.engine_ini_path}")
+    print(f"Applied preset: {preset}")
+
+    if read_only:
+        config_manager.set_read_only(True)
+        print("Engine.ini set to read-only")
+
+
+def _cmd_show(config_manager) -> None:
+    """Print the current Engine.ini."""
+    sys.stdout.write(config_manager.format_current_config())
+
+
+def _cmd_backup(config_manager) -> None:
+    """Back up the current Engine.ini."""
+    backup = config_manager.backup_existing_config()
+    if backup is None:
+        print("No Engine.ini found to backup")
+    elif backup.created:
+        print(f"Backup created: {backup.path}")
+    else:
+        print(f"Backup already up to date: {backup.path}")
+
+
+def _cmd_custom(config_manager, section: str, settings: list[list[str]] | None) -> None:
+    """Merge custom key/value pairs into one Engine.ini section."""
+    if not settings:
+        print("Error: --setting is required for custom command")
+        return
+
+    config_manager.apply_custom_settings({section: dict(settings)})
+    print(f"Custom settings applied to: {config_manager.engine_ini_path}")
+
+
+def _cmd_readonly(engine_ini_path: Path, read_only: bool) -> None:
+    """Set or clear the read-only flag on Engine.ini."""
+    from core.backend import set_file_read_only
+
+    set_file_read_only(engine_ini_path, read_only)
+    if read_only:
+        print("Engine.ini set to read-only")
+    else:
+        print("Engine.ini write permissions restored")
+
+
+def _config_manager(args: argparse.Namespace):
+    """Build the config manager for the global --config-path/--game-version options."""
+    from core.backend import ClairObscurConfig
+
+    return ClairObscurConfig(config_path=args.config_path, game_version=args.game_version)
+
+
+def _engine_ini_path(args: argparse.Namespace) -> Path:
+    """Resolve Engine.ini for the global options without building a config manager."""
+    from core.backend import resolve_config_path
+
+    return resolve_config_path(args.game_version, args.config_path) / "Engine.ini"
+
+
+# CLI commands keyed by subcommand name; each adapter builds only what its handler needs
+HANDLERS = {
+    "create": lambda args: _cmd_create(_config_manager(args), args.preset, not args.no_tweaks, args.read_only),
+    "show": lambda args: _cmd_show(_config_manager(args)),
+    "backup": lambda args: _cmd_backup(_config_manager(args)),
+    "custom": lambda args: _cmd_custom(_config_manager(args), args.section, args.setting),
+    "readonly": lambda args: _cmd_readonly(_engine_ini_path(args), args.status == "on"),
+}
+
+
+def main():
+    """Main CLI interface with Flet GUI and CLI modes."""
+    argv = sys.argv[1:]
+    args = _fast_args(argv) or _build_parser(_builders_for(argv)).parse_args(argv)
 
     try:
         # If no command is specified, launch Flet GUI
         if not args.command:
+            # Flet is only needed for the GUI, so keep it off the CLI import path
+            from core.frontend import run_flet_app
+
             run_flet_app(config_path=args.config_path, game_version=args.game_version)
         else:
             # CLI mode - execute command directly
-            config_manager = ClairObscurConfig(config_path=args.config_path, game_version=args.game_version)
-
-            if args.command == "create":
-                backup_path = config_manager.backup_existing_config()
-                if backup_path:
-                    print(f"Backup created: {backup_path}")
-
-                config_manager.create_engine_ini(preset=args.preset, include_tweaks=not args.no_tweaks)
-                print(f"Engine.ini created: {config_manager.engine_ini_path}")
-                print(f"Applied preset: {args.preset}")
-
-                if args.read_only:
-                    config_manager.set_read_only(True)
-                    print("Engine.ini set to read-only")
-
-            elif args.command == "show":
-                config_manager.show_current_config()
-
-            elif args.command == "backup":
-                backup_path = config_manager.backup_existing_config()
-                if backup_path:
-                    print(f"Backup created: {backup_path}")
-                else:
-                    print("No Engine.ini found to backup")
-
-            elif args.command == "custom":
-                if not args.setting:
-                    print("Error: --setting is required for custom command")
-                    return
-
-                custom_settings = {args.section: dict(args.setting)}
-                config_manager.apply_custom_settings(custom_settings)
-                print(f"Custom settings applied to: {config_manager.engine_ini_path}")
-
-            elif args.command == "readonly":
-                config_manager.set_read_only(args.status == "on")
-                if args.status == "on":
-                    print("Engine.ini set to read-only")
-                else:
-                    print("Engine.ini write permissions restored")
-
-    except Exception as e:
+            HANDLERS[args.command](args)
+
+    except (OSError, ValueError) as e:
         print(f"Error: {e}", file=sys.stderr)
         sys.exit(1)
 
@@ -0,0 +1,36 @@
+#!/usr/bin/env python
+
+"""Round-trip tests for the Engine.ini reader/writer."""
+
+import pytest
+from core import fast_ini
+
+
+def test_round_trip_flat():
+    data = {"SystemSettings": {"r.Fog": "True", "r.Tonemapper.Sharpen": "0.5"}, "Other": {"a": "b=c"}}
+    assert fast_ini.parse(fast_ini.dump(data)) == data
+
+
+def test_round_trip_multiline_fallback():
+    text = "[A]\nk=line1\n  line2\nz=1\n"
+    data = fast_ini.parse(text)
+    assert data == {"A": {"k": "line1\nline2", "z": "1"}}
+
+    # The dumped text must indent continuation lines so the fallback parser reads them back whole
+    assert fast_ini.parse(fast_ini.dump(data)) == data
+
+
+def test_repeated_key_is_rejected():
+    text = "[Core.System]\nPaths=../../../Engine/Content\nPaths=%GAMEDIR%Content\nPaths=../../../Sandfall/Plugins\n"
+
+    # Collapsing the repeats into one value would drop the others on the next write
+    with pytest.raises(ValueError, match="Paths"):
+        fast_ini.parse(text)
+
+
+def test_repeated_key_is_rejected_in_fallback():
+    # The indented continuation line routes this through the configparser fallback
+    text = "[A]\nk=line1\n  line2\nPaths=a\nPaths=b\n"
+
+    with pytest.raises(ValueError, match="Paths"):
+        fast_ini.parse(text)